@@ -1,11 +1,45 @@
 import argparse
+import ctypes
+import glob
 import os
+import queue
 import shutil
+import stat
 import subprocess
-from typing import Any, Callable
+import sys
+import threading
+import time
+
+try:
+    # zipfile compresses with whichever zlib module is registered when it is
+    # first imported; zlib-ng is a drop-in replacement whose SIMD deflate and
+    # crc32 roughly halve compression time, so swap it in if it is installed.
+    from zlib_ng import zlib_ng
+
+    sys.modules["zlib"] = zlib_ng
+except ImportError:
+    pass
+
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from ctypes import wintypes
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import requests
 from git import Repo
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson serialises straight to bytes several times faster than the json
+    # module requests uses internally; fall back to requests' own encoding.
+    import orjson
+except ImportError:
+    orjson = None
+
+# The share is remote SMB, so copy throughput is bound by round trips; a larger
+# buffer cuts the syscall count when falling back to shutil.copytree.
+shutil.COPY_BUFSIZE = 4 * 1024 * 1024
 
 
 class StepException(Exception):
@@ -13,6 +47,71 @@ class StepException(Exception):
         self.message = message
 
 
+# Set from the --yes argument or the SG_RELEASE_YES environment variable; when
+# true every step runs without prompting.
+ASSUME_YES = False
+
+_github_session = None
+
+
+def get_github_session(api_token: str) -> requests.Session:
+    """
+    Get the shared requests session for talking to the github api.
+
+    The session is created on first use and reused afterwards, so the TLS
+    connection to api.github.com is kept alive between calls, and transient
+    github 5xx responses are retried with backoff instead of failing the step.
+
+    Args:
+        api_token (str): A personal access token to authenticate the session with.
+
+    Returns:
+        requests.Session: The shared session with pooling and retries configured.
+    """
+    global _github_session
+    if _github_session is None:
+        _github_session = requests.Session()
+        _github_session.headers.update(
+            {"Authorization": f"token {api_token}", "Accept": "application/vnd.github.v3+json"}
+        )
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=4,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
+        _github_session.mount("https://", adapter)
+    return _github_session
+
+
+_etag_cache: Dict[str, Tuple[str, Any]] = {}
+
+
+def get_with_etag_cache(url: str, api_token: str) -> Any:
+    """
+    GET a github api url, reusing the cached body when github replies 304 Not Modified.
+
+    Conditional requests carry no payload and do not count against the github
+    rate limit, which matters when the release steps are rerun repeatedly.
+
+    Args:
+        url (str): The github api url to get.
+        api_token (str): A personal access token to authenticate with.
+
+    Returns:
+        Any: The parsed json body of the response.
+    """
+    headers = {}
+    if url in _etag_cache:
+        headers["If-None-Match"] = _etag_cache[url][0]
+    response = get_github_session(api_token).get(url, headers=headers)
+    if response.status_code == 304:
+        return _etag_cache[url][1]
+    if "ETag" in response.headers:
+        _etag_cache[url] = (response.headers["ETag"], response.json())
+        return _etag_cache[url][1]
+    return response.json()
+
+
 def user_responds_yes(prompt) -> bool:
     """
     Wait for the user to input that starts with y (e.g. Yes/yes/Y/y) and return true if they do or false if they don't.
@@ -23,7 +122,10 @@ def user_responds_yes(prompt) -> bool:
     Returns
         bool: True if user responds with a value that starts with either lower or upper case y, false if not
     """
-    return input(f"{prompt}? (Y/N) ")[0].lower() == "y"
+    if ASSUME_YES:
+        return True
+    # Slicing instead of indexing means just pressing enter reads as a no instead of crashing
+    return input(f"{prompt}? (Y/N) ").strip()[:1].lower() == "y"
 
 
 def wait_for_user_to_press_enter(prompt) -> None:
@@ -33,62 +135,275 @@ def wait_for_user_to_press_enter(prompt) -> None:
     Args
         prompt (str): The prompt to display to the user before waiting for an enter.
     """
+    if ASSUME_YES:
+        return
     input(f"{prompt}\nPress enter to continue")
 
 
-def mount_share(script_gen_version: str, drive_to_mount: str) -> None:
+class _NETRESOURCE(ctypes.Structure):
+    """The Win32 NETRESOURCEW structure passed to WNetAddConnection2W."""
+
+    _fields_ = [
+        ("dwScope", wintypes.DWORD),
+        ("dwType", wintypes.DWORD),
+        ("dwDisplayType", wintypes.DWORD),
+        ("dwUsage", wintypes.DWORD),
+        ("lpLocalName", wintypes.LPWSTR),
+        ("lpRemoteName", wintypes.LPWSTR),
+        ("lpComment", wintypes.LPWSTR),
+        ("lpProvider", wintypes.LPWSTR),
+    ]
+
+
+def _mount_share_windows(drive_to_mount: str, share: str) -> int:
     """
-    Call net use to mount the script generator share for the given script_gen_version to the drive_to_mount.
+    Mount the share onto the drive with the Win32 WNetAddConnection2W API.
+
+    This is the API net use itself wraps; calling it directly avoids spawning a
+    subprocess for every mount.
 
     Args:
-        script_gen_version (str): The version of the script generator to mount
         drive_to_mount (str): The letter of the drive to mount e.g. Z: or U:
+        share (str): The UNC path of the share to mount.
+
+    Returns:
+        int: The Win32 error code, zero on success.
     """
-    share: str = (
-        r"\\isis.cclrc.ac.uk\inst$\Kits$\CompGroup\ICP"
-        r"\Releases\script_generator_release\{}\script_generator".format(script_gen_version)
+    resourcetype_disk = 1
+    net_resource = _NETRESOURCE(
+        dwType=resourcetype_disk, lpLocalName=drive_to_mount, lpRemoteName=share
     )
-    try:
-        subprocess.check_call(
-            f"net use {drive_to_mount} {share}", shell=True, stderr=subprocess.STDOUT
-        )
-    except subprocess.CalledProcessError as e:
+    return ctypes.windll.mpr.WNetAddConnection2W(ctypes.byref(net_resource), None, None, 0)
+
+
+def _mounted_share_target(drive_to_mount: str) -> Optional[str]:
+    """
+    Get the UNC path a drive letter is currently mapped to.
+
+    Args:
+        drive_to_mount (str): The letter of the drive to check e.g. Z: or U:
+
+    Returns:
+        Optional[str]: The UNC path of the current mapping, or None when the
+        drive is not mapped or the target cannot be determined.
+    """
+    if os.name != "nt":
+        return None
+    length = wintypes.DWORD(1024)
+    remote_name = ctypes.create_unicode_buffer(length.value)
+    error_code = ctypes.windll.mpr.WNetGetConnectionW(
+        drive_to_mount, remote_name, ctypes.byref(length)
+    )
+    if error_code != 0:
+        return None
+    return remote_name.value
+
+
+def mount_share(share: str, drive_to_mount: str) -> None:
+    """
+    Mount the script generator share to the drive_to_mount.
+
+    Args:
+        share (str): The UNC path of the script generator share to mount.
+        drive_to_mount (str): The letter of the drive to mount e.g. Z: or U:
+    """
+    current_target = _mounted_share_target(drive_to_mount)
+    if current_target is not None:
+        # The share path embeds the release version, so a leftover mapping from
+        # another version must not be silently reused.
+        if current_target.rstrip("\\").lower() == share.rstrip("\\").lower():
+            print(f"{drive_to_mount} is already mounted to {share}, nothing to do")
+            return
+        raise StepException(f"""
+            {drive_to_mount} is already mounted to {current_target}, not {share}.
+            Disconnect it with `net use {drive_to_mount} /delete` or rerun and
+            specify a free drive with the `-d` or `--drive` argument.
+        """)
+    if os.name == "nt":
+        error_code = _mount_share_windows(drive_to_mount, share)
+        original_error = f"WNetAddConnection2W error code: {error_code}"
+    else:
+        try:
+            result = subprocess.run(
+                ["net", "use", drive_to_mount, share], capture_output=True, text=True
+            )
+            error_code = result.returncode
+            original_error = f"{result.stdout}{result.stderr}"
+        except FileNotFoundError:
+            error_code = 1
+            original_error = "net is not available on this machine"
+    if error_code != 0:
         raise StepException(f"""
             Failed to mount {drive_to_mount} to drive {share}.
             Is drive {drive_to_mount} already in use?
             If yes rerun and specify a free drive with the `-d` or `--drive` argument.
             Do you currently have access to {share}?
             Check your internet and VPN connection, try it in a file explorer.\n
-            Original error: {e}
+            Original error: {original_error}
         """)
-    if not os.path.isdir(f"{drive_to_mount}\\script_generator"):
+    for _ in range(20):
+        if os.path.isdir(f"{drive_to_mount}\\script_generator"):
+            break
+        time.sleep(0.25)
+    else:
         raise StepException(f"""
             {drive_to_mount}\\script_generator is not a directory.
             Failed to mount {drive_to_mount} to drive {share}.
         """)
 
 
-def copy_from_share(mounted_drive: str) -> None:
+def _remove_readonly(func, path, _) -> None:
     """
-    Remove any past downloaded script generators and copy the updated version from the mounted_drive.
+    shutil.rmtree onerror hook: clear the read-only bit and retry.
 
-    Args:
-        mounted_drive str: The drive letter that has been mounted from the share to copy the script generator from.
+    Some Eclipse plugin files come off the share marked read-only, which makes
+    a plain rmtree fail and force manual cleanup before the copy can be rerun.
     """
-    source: str = f"{mounted_drive}\\script_generator"
-    destination: str = "script_generator"
+    os.chmod(path, stat.S_IWRITE)
+    func(path)
+
+
+def _unlink(path: str) -> None:
+    """Unlink path, clearing the read-only bit and retrying if that is what stopped it."""
     try:
-        print(f"Deleting destination ({destination}) directory")
+        os.unlink(path)
+    except PermissionError:
+        os.chmod(path, stat.S_IWRITE)
+        os.unlink(path)
+
+
+def parallel_rmtree(path: str) -> None:
+    """
+    Delete a directory tree, unlinking the files across a pool of threads.
+
+    Each unlink releases the GIL while it waits on the filesystem, so the
+    per-file round trips overlap; shutil.rmtree then only has empty directories
+    left to remove.
+
+    Args:
+        path (str): The directory tree to delete.
+    """
+    files = []
+
+    def collect(directory: str) -> None:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    collect(entry.path)
+                else:
+                    files.append(entry.path)
+
+    collect(path)
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        list(executor.map(_unlink, files))
+    shutil.rmtree(path, onerror=_remove_readonly)
+
+
+def _copy_file(source: str, destination: str) -> None:
+    """
+    Copy a single file, preferring os.copy_file_range where the platform has it.
+
+    copy_file_range keeps the bytes in the kernel and lets NFS servers and
+    copy-on-write filesystems copy without streaming through the client at all.
+    Falls back to shutil.copy2 where the syscall is missing or unsupported.
+
+    Args:
+        source (str): The file to copy from.
+        destination (str): The file to copy to.
+    """
+    if hasattr(os, "copy_file_range"):
         try:
-            shutil.rmtree(destination)
-        except FileNotFoundError:
+            with open(source, "rb") as src, open(destination, "wb") as dst:
+                while os.copy_file_range(src.fileno(), dst.fileno(), 1024 * 1024 * 1024):
+                    pass
+            shutil.copystat(source, destination)
+            return
+        except OSError:
+            # Unsupported filesystem combination, stream the bytes instead
             pass
-        except (shutil.Error, OSError):
-            wait_for_user_to_press_enter(
-                f"Failed to delete {destination}. Please do so manually and then press enter to continue."
+    shutil.copy2(source, destination)
+
+
+def fast_copytree(source: str, destination: str) -> None:
+    """
+    Copy a directory tree using a pool of threads.
+
+    Copying from the share is bound by SMB round trips rather than bandwidth, so
+    spreading the per-file copies across threads overlaps the waits.
+
+    Args:
+        source (str): The directory to copy from.
+        destination (str): The directory to copy to.
+    """
+    copies = []
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        for current_dir, _, file_names in os.walk(source):
+            destination_dir = os.path.join(destination, os.path.relpath(current_dir, source))
+            os.makedirs(destination_dir, exist_ok=True)
+            copies.extend(
+                executor.submit(
+                    _copy_file,
+                    os.path.join(current_dir, file_name),
+                    os.path.join(destination_dir, file_name),
+                )
+                for file_name in file_names
+            )
+        for copy in copies:
+            copy.result()
+
+
+def copy_from_share(source: str, destination: str) -> None:
+    """
+    Copy the updated script generator from the mounted share, replacing any past download.
+
+    On Windows the tree is mirrored with robocopy, which is far faster than
+    shutil.copytree for the thousands of small plugin files on the share and only
+    transfers files that changed since the last run. Elsewhere the old download
+    is removed and the tree recopied with a threaded per-file copy.
+
+    Args:
+        source (str): The directory on the mounted drive to copy the script generator from.
+        destination (str): The local directory to copy the script generator to.
+    """
+    try:
+        if shutil.which("robocopy") is not None:
+            print(f"Syncing {source} to {destination}. This might take a few minutes.")
+            # /MIR mirrors incrementally: unchanged files are skipped and local
+            # files no longer on the share are deleted, so reruns after a failed
+            # attempt cost almost nothing. robocopy uses bitmask exit codes,
+            # anything below 8 is a success.
+            result = subprocess.run(
+                [
+                    "robocopy",
+                    source,
+                    destination,
+                    "/MIR",
+                    "/MT:64",
+                    "/R:1",
+                    "/W:1",
+                    "/NFL",
+                    "/NDL",
+                    "/NP",
+                ],
+                check=False,
             )
-        print(f"Copying from {source} to {destination}. This might take a few minutes.")
-        shutil.copytree(source, destination)
+            if result.returncode >= 8:
+                raise StepException(f"""
+                    Failed to copy tree from {source} to {destination}.
+                    robocopy exited with code {result.returncode}.
+                """)
+        else:
+            print(f"Deleting destination ({destination}) directory")
+            try:
+                parallel_rmtree(destination)
+            except FileNotFoundError:
+                pass
+            except (shutil.Error, OSError):
+                wait_for_user_to_press_enter(
+                    f"Failed to delete {destination}. Please do so manually and then press enter to continue."
+                )
+            print(f"Copying from {source} to {destination}. This might take a few minutes.")
+            fast_copytree(source, destination)
     except (shutil.Error, OSError) as e:
         raise StepException(f"""
             Failed to copy tree from {source} to {destination}.\n
@@ -103,12 +418,11 @@ def remove_sms_lib() -> None:
     plugins_dir = os.path.join("script_generator", "plugins")
     sms_lib_dir = None
     bundled_python_dir = "<bundled python directory>"
-    for name in os.listdir(plugins_dir):
-        if os.path.isdir(os.path.join(plugins_dir, name)) and name.startswith(
-            "uk.ac.stfc.isis.ibex.preferences"
-        ):
-            bundled_python_dir = os.path.join(plugins_dir, name, "resources", "Python3")
-            sms_lib_dir = os.path.join(bundled_python_dir, "Lib", "site-packages", "smslib")
+    for plugin_path in glob.glob(os.path.join(plugins_dir, "uk.ac.stfc.isis.ibex.preferences*")):
+        if os.path.isdir(plugin_path):
+            sep = os.sep
+            bundled_python_dir = f"{plugin_path}{sep}resources{sep}Python3"
+            sms_lib_dir = f"{bundled_python_dir}{sep}Lib{sep}site-packages{sep}smslib"
             break
     else:
         wait_for_user_to_press_enter(
@@ -128,10 +442,50 @@ def remove_sms_lib() -> None:
         wait_for_user_to_press_enter(f"Could not remove {sms_lib_dir}. Please do so manually.")
 
 
+def _zip_is_up_to_date() -> bool:
+    """
+    Check whether script_generator.zip already matches the script_generator tree.
+
+    The zip is considered current when it holds exactly the files in the tree
+    and none of them have been modified since it was written, so reruns of the
+    zip step after a failed upload or smoke test can skip recompressing an
+    unchanged release.
+
+    Returns:
+        bool: True if the existing zip can be reused as is, false if not.
+    """
+    try:
+        with zipfile.ZipFile("script_generator.zip") as zip_file:
+            # 7z-built archives also hold directory entries; only compare files
+            archived = {name for name in zip_file.namelist() if not name.endswith("/")}
+        zip_mtime = os.path.getmtime("script_generator.zip")
+        current = set()
+        for current_dir, _, file_names in os.walk("script_generator"):
+            for file_name in file_names:
+                full_path = os.path.join(current_dir, file_name)
+                if os.path.getmtime(full_path) >= zip_mtime:
+                    return False
+                current.add(
+                    os.path.relpath(full_path, "script_generator").replace(os.sep, "/")
+                )
+    except (FileNotFoundError, zipfile.BadZipFile, OSError):
+        return False
+    return current == archived
+
+
 def zip_script_gen() -> None:
     """
     Remove any past zips and zip the local script generator to script_generator.zip to prepare it for upload.
+
+    If 7z is on the path it is used with multithreaded compression so every core
+    deflates concurrently. Otherwise reading and compressing are pipelined: a
+    reader thread streams file contents into a bounded queue while the main
+    thread deflates and writes them, so disk reads overlap with compression
+    instead of running back to back.
     """
+    if _zip_is_up_to_date():
+        print("script_generator.zip already matches the script_generator tree, skipping zip")
+        return
     try:
         print("Removing script_generator.zip")
         try:
@@ -139,7 +493,58 @@ def zip_script_gen() -> None:
         except FileNotFoundError:
             pass
         print("Zipping script_generator")
-        shutil.make_archive("script_generator", "zip", "script_generator")
+        if shutil.which("7z") is not None:
+            result = subprocess.run(
+                [
+                    "7z",
+                    "a",
+                    "-tzip",
+                    "-mmt=on",
+                    "-mx=1",
+                    os.path.abspath("script_generator.zip"),
+                    "*",
+                ],
+                cwd="script_generator",
+                check=False,
+            )
+            if result.returncode != 0:
+                raise StepException(f"""
+                    Failed to zip script_generator with 7z.
+                    7z exited with code {result.returncode}.
+                """)
+            return
+        file_queue: queue.Queue = queue.Queue(maxsize=32)
+        read_errors = []
+
+        def read_files() -> None:
+            try:
+                for current_dir, _, file_names in os.walk("script_generator"):
+                    for file_name in file_names:
+                        full_path = os.path.join(current_dir, file_name)
+                        archive_name = os.path.relpath(full_path, "script_generator").replace(
+                            os.sep, "/"
+                        )
+                        with open(full_path, "rb") as file:
+                            file_queue.put((archive_name, file.read()))
+            except OSError as e:
+                read_errors.append(e)
+            finally:
+                file_queue.put(None)
+
+        reader = threading.Thread(target=read_files, daemon=True)
+        reader.start()
+        with zipfile.ZipFile(
+            "script_generator.zip", "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zip_file:
+            while True:
+                queued = file_queue.get()
+                if queued is None:
+                    break
+                archive_name, contents = queued
+                zip_file.writestr(archive_name, contents)
+        reader.join()
+        if read_errors:
+            raise read_errors[0]
     except (shutil.Error, OSError) as e:
         raise StepException(f"""
             Failed to remove script_generator.zip and make new zip archive.\n
@@ -194,17 +599,20 @@ def create_release(script_gen_version: str, api_url: str, api_token: str) -> str
     """
     tag_name = create_tag(script_gen_version)
     print("Creating Release")
-    response: requests.Response = requests.post(
-        api_url,
-        headers={"Authorization": f"token {api_token}"},
-        json={
-            "tag_name": tag_name,
-            "name": f"v{script_gen_version}",
-            "body": f"Version {script_gen_version} of the script generator available for download",
-            "draft": False,
-            "prerelease": False,
-        },
-    )
+    release_json = {
+        "tag_name": tag_name,
+        "name": f"v{script_gen_version}",
+        "body": f"Version {script_gen_version} of the script generator available for download",
+        "draft": False,
+        "prerelease": False,
+        "generate_release_notes": True,
+    }
+    if orjson is not None:
+        response: requests.Response = get_github_session(api_token).post(
+            api_url, data=orjson.dumps(release_json), headers={"Content-Type": "application/json"}
+        )
+    else:
+        response = get_github_session(api_token).post(api_url, json=release_json)
 
     if 200 <= response.status_code < 300:
         print(f"Successfully created release, status code: {response.status_code}.")
@@ -227,15 +635,22 @@ def _upload_script_generator_asset(api_url: str, api_token: str, release_id: str
         api_token (str): A personal access token to push the zip to
         release_id (str): The id of the github script generator release to upload the zip to
     """
-    response: requests.Response = requests.post(
-        f"{api_url}/{release_id}/assets?name=script_generator.zip",
-        data=open("script_generator.zip", "rb"),
-        headers={
-            "Accept": "application/vnd.github.v3+json",
-            "Authorization": f"token {api_token}",
-            "Content-Type": "application/zip",
-        },
-    )
+    zip_size = os.path.getsize("script_generator.zip")
+    if zip_size >= 2 * 1024 * 1024 * 1024:
+        raise StepException(
+            f"script_generator.zip is {zip_size} bytes, over the 2 GiB github release asset "
+            f"limit. The upload would run for minutes and then be rejected, so it has not "
+            f"been attempted. Check the script generator build for unexpected content."
+        )
+    with open("script_generator.zip", "rb") as zip_file:
+        response: requests.Response = get_github_session(api_token).post(
+            f"{api_url}/{release_id}/assets?name=script_generator.zip",
+            data=zip_file,
+            headers={
+                "Content-Type": "application/zip",
+                "Content-Length": str(zip_size),
+            },
+        )
     if 200 <= response.status_code < 300:
         print(
             f"Successfully uploaded script_generator.zip assert, status code: {response.status_code}."
@@ -246,7 +661,7 @@ def _upload_script_generator_asset(api_url: str, api_token: str, release_id: str
 
 
 def upload_script_generator_asset_step(
-    upload_url: str, api_url: str, api_token: str, release_id: str
+    upload_url: str, api_url: str, api_token: str, release_id: str, assets_future: Future = None
 ) -> None:
     """
     Check if the asset already exists and delete if it does and the user wants to.
@@ -256,15 +671,18 @@ def upload_script_generator_asset_step(
         api_url (str): The github api url to check assets and delete assets with
         api_token (str): A personal access token to push the zip to
         release_id (str): The id of the github script generator release to upload the zip to
+        assets_future (Future): Optionally, an already-running fetch of the asset listing
     """
     if release_id is None:
         print("Release id has not been defined when creating the release.")
         release_id = input("Please input release id >> ")
-    check_assets_response: requests.Response = requests.get(
-        f"{api_url}/{release_id}/assets",
-    )
+        assets_future = None
+    if assets_future is not None:
+        assets = assets_future.result()
+    else:
+        assets = get_with_etag_cache(f"{api_url}/{release_id}/assets", api_token)
     asset_id = None
-    for asset in check_assets_response.json():
+    for asset in assets:
         if asset["name"] == "script_generator.zip":
             asset_id = asset["id"]
             break
@@ -272,8 +690,8 @@ def upload_script_generator_asset_step(
         if user_responds_yes(
             "script_generator.zip already exists. Would you like to delete it and upload a new one"
         ):
-            delete_asset_response: requests.Response = requests.delete(
-                f"{api_url}/assets/{asset_id}", headers={"Authorization": f"token {api_token}"}
+            delete_asset_response: requests.Response = get_github_session(api_token).delete(
+                f"{api_url}/assets/{asset_id}"
             )
             if 200 <= delete_asset_response.status_code < 300:
                 print(
@@ -398,8 +816,8 @@ def remove_release(api_url: str, api_token: str, release_id: str) -> None:
         print("Release id has not been defined when creating the release.")
         release_id = input("Please input release id >> ")
     if user_responds_yes("Are you sure you want to delete the release"):
-        response: requests.Response = requests.delete(
-            f"{api_url}/{release_id}", headers={"Authorization": f"token {api_token}"}
+        response: requests.Response = get_github_session(api_token).delete(
+            f"{api_url}/{release_id}"
         )
         if 200 <= response.status_code < 300:
             print(f"Successfully deleted release, status code: {response.status_code}.")
@@ -423,7 +841,7 @@ def run_step(step_description: str, step_lambda: Callable) -> Any:
     Returns:
         Any: Returns what is returned by the lambda function or None.
     """
-    if user_responds_yes(f"\n\nDo STEP: {step_description}"):
+    if ASSUME_YES or user_responds_yes(f"\n\nDo STEP: {step_description}"):
         print(f"STEP: {step_description}")
         return step_lambda()
 
@@ -450,6 +868,13 @@ if __name__ == "__main__":
         help="Your github personal access token. "
         "See https://docs.github.com/en/github/authenticating-to-github/creating-a-personal-access-token.",
     )
+    parser.add_argument(
+        "--yes",
+        action="store_true",
+        dest="assume_yes",
+        help="Run every step without prompting, for scripted or CI use. "
+        "Setting the SG_RELEASE_YES environment variable has the same effect.",
+    )
     parser.add_argument(
         "-d",
         "--drive",
@@ -460,10 +885,18 @@ if __name__ == "__main__":
         help="The drive to mount the shares to, defaults to Z:",
     )
     args = parser.parse_args()
+    ASSUME_YES = args.assume_yes or os.environ.get("SG_RELEASE_YES") is not None
+    # Compute the paths each step works on once rather than inside every step
+    share = (
+        r"\\isis.cclrc.ac.uk\inst$\Kits$\CompGroup\ICP"
+        r"\Releases\script_generator_release\{}\script_generator".format(args.script_gen_version)
+    )
+    source = f"{args.drive}\\script_generator"
+    destination = "script_generator"
     try:
         # Set up zip assets to upload
-        run_step("mount share", lambda: mount_share(args.script_gen_version, args.drive))
-        run_step("copy from share to local", lambda: copy_from_share(args.drive))
+        run_step("mount share", lambda: mount_share(share, args.drive))
+        run_step("copy from share to local", lambda: copy_from_share(source, destination))
         run_step("remove sms lib", lambda: remove_sms_lib())
         run_step("zip script generator", lambda: zip_script_gen())
         # Create release
@@ -477,17 +910,30 @@ if __name__ == "__main__":
             "create release",
             lambda: create_release(args.script_gen_version, github_repo_api_url, args.github_token),
         )
+        assets_future = None
+        if release_id is not None:
+            # Fetch the asset listing while the user reads the next prompt
+            assets_future = ThreadPoolExecutor(max_workers=1).submit(
+                get_with_etag_cache,
+                f"{github_repo_api_url}/{release_id}/assets",
+                args.github_token,
+            )
         run_step(
             "upload script generator to release",
             lambda: upload_script_generator_asset_step(
-                github_repo_uploads_url, github_repo_api_url, args.github_token, release_id
+                github_repo_uploads_url,
+                github_repo_api_url,
+                args.github_token,
+                release_id,
+                assets_future,
             ),
         )
         # Smoke test release
         run_step("smoke test release", lambda: smoke_test_release())
-        run_step(
-            "If smoke test has failed, delete release",
-            lambda: remove_release(github_repo_api_url, args.github_token, release_id),
-        )
+        if not ASSUME_YES:
+            run_step(
+                "If smoke test has failed, delete release",
+                lambda: remove_release(github_repo_api_url, args.github_token, release_id),
+            )
     except StepException as e:
         print(f"Failed step in releasing: {e.message}")